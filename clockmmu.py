@@ -1,4 +1,5 @@
 from mmu import MMU
+from array import array
 
 
 class ClockMMU(MMU):
@@ -6,8 +7,12 @@ class ClockMMU(MMU):
         # TODO: Constructor logic for EscMMU
         # Number of physical frames in memory
         self.number_frames = frames
-        # List of frames that implement "clock" structure
-        self.frames = []
+        # Parallel arrays that implement "clock" structure, indexed by frame
+        self.pages = array('q', [-1]) * frames
+        self.dirty = bytearray(frames)
+        self.reference = bytearray(frames)
+        # Map of loaded page -> frame index
+        self.page_to_index = {}
         #  Clock hand pointer
         self.clock_hand = 0
         # Statistics for analysis
@@ -16,14 +21,24 @@ class ClockMMU(MMU):
         self.disk_writes = 0
         # Debug mode flag
         self.debug = False
+        # Last accessed page and its frame, checked before the dictionary lookup
+        self.last_page = -1
+        self.last_index = -1
+        self.reset_debug()
 
     def set_debug(self):
         # TODO: Implement the method to set debug mode
         self.debug = True
+        # Use the general read_memory/write_memory, which print from access_memory
+        self.__dict__.pop("read_memory", None)
+        self.__dict__.pop("write_memory", None)
 
     def reset_debug(self):
         # TODO: Implement the method to reset debug mode
         self.debug = False
+        # Dispatch straight to the quiet accessors specialized for reads and writes
+        self.read_memory = self.quiet_read
+        self.write_memory = self.quiet_write
 
     def read_memory(self, page_number):
         # TODO: Implement the method to read memory
@@ -33,6 +48,32 @@ class ClockMMU(MMU):
         # TODO: Implement the method to write memory
         self.access_memory(page_number, is_write=True)
 
+    def quiet_read(self, page_number):
+        # Read without debug output: hits are handled here, faults in access_memory
+        if page_number == self.last_page:
+            return
+        index = self.page_to_index.get(page_number)
+        if index is None:
+            self.access_memory(page_number, False)
+            return
+        self.reference[index] = 1
+        self.last_page = page_number
+        self.last_index = index
+
+    def quiet_write(self, page_number):
+        # Write without debug output: hits are handled here, faults in access_memory
+        if page_number == self.last_page:
+            self.dirty[self.last_index] = 1
+            return
+        index = self.page_to_index.get(page_number)
+        if index is None:
+            self.access_memory(page_number, True)
+            return
+        self.reference[index] = 1
+        self.dirty[index] = 1
+        self.last_page = page_number
+        self.last_index = index
+
     def get_total_disk_reads(self):
         # TODO: Implement the method to get total disk reads
         return self.disk_reads
@@ -46,60 +87,101 @@ class ClockMMU(MMU):
         return self.page_faults
     
     def access_memory(self, page_number, is_write):
-        
+        # Repeated access to the last page: already resident with reference bit 1
+        if page_number == self.last_page:
+            if is_write:
+                self.dirty[self.last_index] = 1
+            if self.debug:
+                print(f"HIT: Page {page_number}. Dirty: {bool(self.dirty[self.last_index])}. Reference: 1")
+            return
+
+        # Local aliases for the attributes used on the hit path
+        page_to_index = self.page_to_index
+        dirty = self.dirty
+        reference = self.reference
+        debug = self.debug
+
         # Page HIT (in memory)
-        for frame in self.frames:
-            if frame["page"] == page_number:
-                # Set reference bit to 1
-                frame["reference"] = 1
-                if is_write:
-                    frame["dirty"] = True
-                if self.debug:
-                    print(f"HIT: Page {page_number}. Dirty: {frame['dirty']}. Reference: 1")
-                return
+        index = page_to_index.get(page_number)
+        if index is not None:
+            # Set reference bit to 1
+            reference[index] = 1
+            if is_write:
+                dirty[index] = 1
+            self.last_page = page_number
+            self.last_index = index
+            if debug:
+                print(f"HIT: Page {page_number}. Dirty: {bool(dirty[index])}. Reference: 1")
+            return
         
         # Page FAULT (not in memory)
         self.page_faults += 1
         self.disk_reads += 1
-        if self.debug:
+        if debug:
             print(f"FAULT: Page {page_number}")
 
-        # Append frame if there is space
-        if len(self.frames) < self.number_frames:
-            self.frames.append({"page": page_number, "dirty": is_write, "reference": 1})
-            if self.debug:
+        # Fill next free frame if there is space
+        used_frames = len(page_to_index)
+        if used_frames < self.number_frames:
+            self.load_page(used_frames, page_number, is_write)
+            if debug:
                 print(f"LOADED: Page {page_number}. Dirty: {is_write}. Reference: 1 (Free slot)")
             return
         
         # Remove page with clock algorithm
         removing_page_index = self.find_removing_page()
-        removing_page = self.frames[removing_page_index]
+        removing_page = self.pages[removing_page_index]
 
-        if removing_page["dirty"]:
+        if dirty[removing_page_index]:
             self.disk_writes += 1
-            if self.debug:
-                print(f"REMOVING: Dirty {removing_page['page']}")
+            if debug:
+                print(f"REMOVING: Dirty {removing_page}")
         else:
-            if self.debug:
-                print(f"REMOVING: Clean {removing_page['page']}")
+            if debug:
+                print(f"REMOVING: Clean {removing_page}")
 
         # Replace removed page with new page
-        self.frames[removing_page_index] = {"page": page_number, "dirty": is_write, "reference": 1}
-        if self.debug:
+        del page_to_index[removing_page]
+        self.load_page(removing_page_index, page_number, is_write)
+        if debug:
             print(f"LOADED: Page {page_number}. Dirty: {is_write}. Reference: 1 (Replaced page)")
 
+    def load_page(self, index, page_number, is_write):
+        # Place page in frame with reference bit set
+        self.pages[index] = page_number
+        self.dirty[index] = is_write
+        self.reference[index] = 1
+        self.page_to_index[page_number] = index
+        self.last_page = page_number
+        self.last_index = index
+
     def find_removing_page(self):
-        # If reference bit 0, remove page. If 1, set to 0 and move clock hand
-        while True:
-            frame = self.frames[self.clock_hand]
-            if frame["reference"] == 0:
-                removing_page_index = self.clock_hand
-                # Advance clock hand
-                self.clock_hand = (self.clock_hand + 1) % self.number_frames
-                return removing_page_index
+        # If reference bit 0, remove page. If 1, set to 0 and move clock hand.
+        # bytearray.find locates the next 0 bit in C instead of looping per frame
+        reference = self.reference
+        hand = self.clock_hand
+        removing_page_index = reference.find(0, hand)
+        if removing_page_index >= 0:
+            self.give_second_chances(hand, removing_page_index)
+        else:
+            # Every frame from the hand to the end is referenced, wrap around
+            self.give_second_chances(hand, self.number_frames)
+            removing_page_index = reference.find(0, 0, hand)
+            if removing_page_index >= 0:
+                self.give_second_chances(0, removing_page_index)
             else:
-                # Give second chance (set reference from 1 to 0)
-                frame["reference"] = 0
-                if self.debug:
-                    print(f"SECOND CHANCE: Page {frame['page']}. Reference: 0")
-                self.clock_hand = (self.clock_hand + 1) % self.number_frames
\ No newline at end of file
+                # Every frame was referenced, so a full sweep ends back at the hand
+                self.give_second_chances(0, hand)
+                removing_page_index = hand
+        # Advance clock hand
+        self.clock_hand = (removing_page_index + 1) % self.number_frames
+        return removing_page_index
+
+    def give_second_chances(self, start, stop):
+        # Give second chance (set reference from 1 to 0) to frames start..stop-1
+        if start >= stop:
+            return
+        if self.debug:
+            for index in range(start, stop):
+                print(f"SECOND CHANCE: Page {self.pages[index]}. Reference: 0")
+        self.reference[start:stop] = bytes(stop - start)
@@ -5,60 +5,54 @@ Experiment runner for the VM replacement simulator.
 Usage examples (Windows PowerShell):
   py .\experiment_runner.py --memsim .\memsim.py
   py .\experiment_runner.py --memsim .\memsim.py --frames 4,8,16,32,64,128,256 --algos lru,clock --traces swim.trace,bzip.trace,gcc.trace,sixpack.trace
-  py .\experiment_runner.py --memsim .\memsim.py --python python  # specify the interpreter used to run memsim.py
+  py .\experiment_runner.py --memsim .\memsim.py --engine numba  # compiled kernels, needs numpy + numba
+  py .\experiment_runner.py --memsim .\memsim.py --engine subprocess --python python  # run memsim.py itself with the given interpreter
+
+By default the MMU classes next to memsim.py are imported and driven in-process,
+so each trace is parsed once and shared by every (algo, frames) run instead of once per
+memsim.py invocation.
 """
 import argparse
 import csv
 import math
+import mmap
+import os
+import random
 import re
 import subprocess
 import sys
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 DEFAULT_TRACES = ["swim.trace", "bzip.trace", "gcc.trace", "sixpack.trace"]
 DEFAULT_FRAMES = [4, 8, 16, 32, 64, 128, 256, 512]
-DEFAULT_ALGOS  = ["lru", "clock"]  # add "rand" if you want; results will vary run-to-run
-RAND_REPEATS   = 3  # how many times to repeat rand and average
+DEFAULT_ALGOS  = ["lru", "clock"]  # add "rand" if you want; averaged over seeded repeats
+RAND_REPEATS   = 3  # how many times to repeat rand and average (default for --repeats)
+PAGE_OFFSET    = 12  # page is 2^12 = 4KB, same as memsim.py
 
 STATS_FIELDS = ["frames", "events", "reads", "writes", "rate"]
+# one results.csv row; a plain tuple so csv.writer can write it directly
+Row = namedtuple("Row", ["trace", "algo", "frames", "events", "reads", "writes", "rate", "repeats"])
 
-_stats_re = re.compile(
-    r"total memory frames:\s*(?P<frames>\d+)\s*"
-    r"events in trace:\s*(?P<events>\d+)\s*"
-    r"total disk reads:\s*(?P<reads>\d+)\s*"
-    r"total disk writes:\s*(?P<writes>\d+)\s*"
-    r"page fault rate:\s*(?P<rate>[\d.]+)\s*",
-    re.IGNORECASE | re.DOTALL
+# one pass over the whole memsim output; each summary line is "<label>: <value>"
+_LINE_RE = re.compile(
+    r"(?im)^\s*(total memory frames|events in trace|total disk reads|total disk writes|page fault rate)"
+    r"\s*:\s*([\d.]+)"
 )
+_LINE_FIELDS = {
+    "total memory frames": ("frames", int),
+    "events in trace": ("events", int),
+    "total disk reads": ("reads", int),
+    "total disk writes": ("writes", int),
+    "page fault rate": ("rate", float),
+}
 
 def parse_stats(text: str):
-    m = _stats_re.search(text)
-    if m:
-        d = m.groupdict()
-        return {
-            "frames": int(d["frames"]),
-            "events": int(d["events"]),
-            "reads": int(d["reads"]),
-            "writes": int(d["writes"]),
-            "rate": float(d["rate"]),
-        }
-    # tolerant line-by-line parsing
-    vals = {"frames": None, "events": None, "reads": None, "writes": None, "rate": None}
-    for line in text.splitlines():
-        low = line.strip().lower()
-        if low.startswith("total memory frames:"):
-            vals["frames"] = int(re.findall(r"\d+", line)[0])
-        elif low.startswith("events in trace:"):
-            vals["events"] = int(re.findall(r"\d+", line)[0])
-        elif low.startswith("total disk reads:"):
-            vals["reads"] = int(re.findall(r"\d+", line)[0])
-        elif low.startswith("total disk writes:"):
-            vals["writes"] = int(re.findall(r"\d+", line)[0])
-        elif low.startswith("page fault rate:"):
-            vals["rate"] = float(re.findall(r"[0-9.]+", line)[0])
-    if any(v is None for v in vals.values()):
+    found = dict((m.group(1).lower(), m.group(2)) for m in _LINE_RE.finditer(text))
+    if len(found) != len(_LINE_FIELDS):
         raise ValueError("Could not parse stats from memsim output.")
-    return vals
+    return {key: cast(found[label]) for label, (key, cast) in _LINE_FIELDS.items()}
 
 def run_once(pyexe: str, memsim: Path, trace: Path, frames: int, algo: str):
     proc = subprocess.run(
@@ -69,6 +63,95 @@ def run_once(pyexe: str, memsim: Path, trace: Path, frames: int, algo: str):
         raise RuntimeError(f"memsim.py failed (frames={frames}, algo={algo}, trace={trace.name}):\n{proc.stderr}")
     return parse_stats(proc.stdout)
 
+def load_policies(memsim: Path):
+    # import the MMU classes that live next to memsim.py
+    mmu_dir = str(memsim.parent)
+    if mmu_dir not in sys.path:
+        sys.path.insert(0, mmu_dir)
+    from clockmmu import ClockMMU
+    from lrummu import LruMMU
+    from randmmu import RandMMU
+    return {"lru": LruMMU, "clock": ClockMMU, "rand": RandMMU}
+
+def load_trace(trace: Path):
+    # parse the trace into parallel lists of page numbers and write flags;
+    # the file is mapped and tokenized with bytes.split, so no Python-level line loop
+    with trace.open("rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            return [], []
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            tokens = mm[:].split()
+    addrs, ops = tokens[0::2], tokens[1::2]
+    if len(addrs) != len(ops) or not set(ops) <= {b"R", b"W"}:
+        bad = next((i for i, op in enumerate(ops) if op not in (b"R", b"W")), len(ops))
+        raise ValueError(f"Badly formatted trace {trace.name}: error on event {bad + 1}")
+    pages = [int(addr, 16) >> PAGE_OFFSET for addr in addrs]
+    writes = [op == b"W" for op in ops]
+    return pages, writes
+
+def prepare_trace(engine: str, trace: Path):
+    # load a trace once for every (algo, frames) config it is run with
+    if engine == "subprocess":
+        return None  # memsim.py reads the file itself
+    pages, writes = load_trace(trace)
+    if not pages:
+        raise ValueError(f"Trace {trace.name} has no events.")
+    if engine == "numba":
+        import numpy as np
+        return np.array(pages, dtype=np.int64), np.array(writes, dtype=np.bool_)
+    return pages, writes
+
+def replay(mmu, pages, writes):
+    read_memory = mmu.read_memory
+    write_memory = mmu.write_memory
+    for page, is_write in zip(pages, writes):
+        if is_write:
+            write_memory(page)
+        else:
+            read_memory(page)
+
+def run_one_config(engine: str, pyexe: str, memsim: Path, trace: Path, loaded, algo: str, frames: int,
+                   seed: int = 0):
+    # one (trace, algo, frames) run against a trace loaded by prepare_trace;
+    # rand repeats use their repeat number as seed (memsim.py itself cannot be seeded)
+    if engine == "subprocess":
+        return run_once(pyexe, memsim, trace, frames, algo)
+    pages, writes = loaded
+    if engine == "numba":
+        # compiled kernels from mmu_kernels.py (optional numpy + numba)
+        from mmu_kernels import KERNELS
+        if algo == "rand":
+            faults, reads, disk_writes = KERNELS[algo](pages, writes, frames, seed)
+        else:
+            faults, reads, disk_writes = KERNELS[algo](pages, writes, frames)
+    else:
+        mmu_class = load_policies(memsim)[algo]
+        mmu = mmu_class(frames, random.Random(seed)) if algo == "rand" else mmu_class(frames)
+        mmu.reset_debug()
+        replay(mmu, pages, writes)
+        faults = mmu.get_total_page_faults()
+        reads = mmu.get_total_disk_reads()
+        disk_writes = mmu.get_total_disk_writes()
+    events = len(pages)
+    return {
+        "frames": frames,
+        "events": events,
+        "reads": reads,
+        "writes": disk_writes,
+        # rounded like the memsim.py summary line
+        "rate": round(faults / events, 4),
+    }
+
+# traces loaded once in the parent, handed to each worker process by _init_worker
+_LOADED_TRACES = {}
+
+def _init_worker(loaded_traces):
+    _LOADED_TRACES.update(loaded_traces)
+
+def run_job(engine: str, pyexe: str, memsim: Path, trace: Path, algo: str, frames: int, seed: int):
+    # a top-level function so worker processes can pickle it
+    return run_one_config(engine, pyexe, memsim, trace, _LOADED_TRACES[trace], algo, frames, seed)
+
 def ensure_traces(traces):
     ok = []
     for t in traces:
@@ -87,17 +170,32 @@ def ensure_traces(traces):
 def main(argv=None):
     ap = argparse.ArgumentParser(description="Run VM replacement experiments and plot results.")
     ap.add_argument("--memsim", required=True, help="Path to memsim.py")
-    ap.add_argument("--python", default=sys.executable, help="Python interpreter to run memsim.py")
+    ap.add_argument("--python", default=sys.executable, help="Python interpreter to run memsim.py (subprocess engine)")
+    ap.add_argument("--engine", choices=["inprocess", "subprocess", "numba"], default="inprocess",
+                    help="inprocess: import the MMUs next to memsim.py; subprocess: run memsim.py per config; "
+                         "numba: compiled kernels from mmu_kernels.py (needs numpy and numba)")
     ap.add_argument("--traces", default=",".join(DEFAULT_TRACES), help="Comma-separated trace filenames")
     ap.add_argument("--frames", default=",".join(map(str, DEFAULT_FRAMES)), help="Comma-separated frame counts")
     ap.add_argument("--algos",  default=",".join(DEFAULT_ALGOS),  help="Comma-separated algos: lru,clock,rand")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes to run configs in parallel (1 = run serially)")
+    ap.add_argument("--repeats", type=int, default=RAND_REPEATS,
+                    help="Seeded runs to average for rand (all share one parsed trace)")
     ap.add_argument("--outdir", default="results", help="Directory to write CSV and plots")
     args = ap.parse_args(argv)
+    if args.repeats < 1:
+        ap.error("--repeats must be at least 1")
 
     memsim = Path(args.memsim).resolve()
     if not memsim.exists():
         ap.error(f"memsim.py not found: {memsim}")
 
+    if args.engine == "numba":
+        try:
+            import mmu_kernels  # noqa: F401
+        except ImportError:
+            ap.error("--engine numba requires numpy and numba (python -m pip install numba)")
+
     traces = [s.strip() for s in args.traces.split(",") if s.strip()]
     frames = [int(x) for x in args.frames.split(",") if x.strip()]
     algos  = [s.strip() for s in args.algos.split(",") if s.strip()]
@@ -109,51 +207,47 @@ def main(argv=None):
     if not trace_paths:
         ap.error("No valid traces found.")
 
+    # parse each trace once and share it across every (algo, frames, repeat) run
+    loaded = {trace: prepare_trace(args.engine, trace) for trace in trace_paths}
+    # every run is independent: one job per (trace, algo, frames, repeat)
+    jobs = [(trace, algo, f, rep)
+            for trace in trace_paths
+            for algo in algos
+            for f in frames
+            for rep in range(args.repeats if algo == "rand" else 1)]
+    results = {}
+    if args.jobs <= 1:
+        for trace, algo, f, rep in jobs:
+            results[(trace, algo, f, rep)] = run_one_config(
+                args.engine, args.python, memsim, trace, loaded[trace], algo, f, rep)
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker, initargs=(loaded,)) as ex:
+            futures = {ex.submit(run_job, args.engine, args.python, memsim, trace, algo, f, rep): (trace, algo, f, rep)
+                       for trace, algo, f, rep in jobs}
+            for fut in as_completed(futures):
+                results[futures[fut]] = fut.result()
+
     rows = []
     for trace in trace_paths:
         for algo in algos:
-            if algo == "rand":
-                # run multiple times and average
-                agg = {"frames": None, "events": None, "reads": [], "writes": [], "rate": []}
-                for f in frames:
-                    reps = []
-                    for _ in range(RAND_REPEATS):
-                        r = run_once(args.python, memsim, trace, f, algo)
-                        reps.append(r)
+            for f in frames:
+                # in repeat order, so the averages do not depend on completion order
+                reps = [results[(trace, algo, f, rep)] for rep in range(args.repeats if algo == "rand" else 1)]
+                if algo == "rand":
                     # average reads/writes/rate; keep frames/events from first
                     avg_reads  = sum(x["reads"] for x in reps) / len(reps)
                     avg_writes = sum(x["writes"] for x in reps) / len(reps)
                     avg_rate   = sum(x["rate"] for x in reps) / len(reps)
-                    rows.append({
-                        "trace": trace.name,
-                        "algo": algo,
-                        "frames": f,
-                        "events": reps[0]["events"],
-                        "reads": avg_reads,
-                        "writes": avg_writes,
-                        "rate": avg_rate,
-                        "repeats": len(reps)
-                    })
-            else:
-                for f in frames:
-                    r = run_once(args.python, memsim, trace, f, algo)
-                    rows.append({
-                        "trace": trace.name,
-                        "algo": algo,
-                        "frames": f,
-                        "events": r["events"],
-                        "reads": r["reads"],
-                        "writes": r["writes"],
-                        "rate": r["rate"],
-                        "repeats": 1
-                    })
+                    rows.append(Row(trace.name, algo, f, reps[0]["events"],
+                                    avg_reads, avg_writes, avg_rate, len(reps)))
+                else:
+                    r = reps[0]
+                    rows.append(Row(trace.name, algo, f, r["events"], r["reads"], r["writes"], r["rate"], 1))
 
     # write CSV
     csv_path = outdir / "results.csv"
     with csv_path.open("w", newline="", encoding="utf-8") as fp:
-        w = csv.DictWriter(fp, fieldnames=["trace","algo","frames","events","reads","writes","rate","repeats"])
-        w.writeheader()
-        w.writerows(rows)
+        csv.writer(fp).writerows([Row._fields, *rows])
     print(f"[OK] Wrote {csv_path}")
 
     # plots
@@ -164,65 +258,38 @@ def main(argv=None):
         return 0
 
     # Per-trace plots: page-fault rate vs frames (log2 x), one plot per trace
-    from collections import defaultdict
     by_trace = defaultdict(list)
     for row in rows:
-        by_trace[row["trace"]].append(row)
+        by_trace[row.trace].append(row)
 
+    # (metric, y label, title, file suffix) for the three per-trace plots
+    plots = [
+        ("rate",   "Page fault rate",   "Page Fault Rate vs Frames", "pfr"),
+        ("writes", "Total disk writes", "Disk Writes vs Frames",     "writes"),
+        ("reads",  "Total disk reads",  "Disk Reads vs Frames",      "reads"),
+    ]
+    # one Figure reused for every plot; clearing the axes is much cheaper than a new figure
+    fig, ax = plt.subplots()
     for trace_name, data in by_trace.items():
         # sort by frames
-        data.sort(key=lambda r: (r["algo"], r["frames"]))
-        # 1) page fault rate
-        plt.figure()
-        algos_present = sorted({r["algo"] for r in data})
-        for algo in algos_present:
-            xs = [r["frames"] for r in data if r["algo"] == algo]
-            ys = [r["rate"]   for r in data if r["algo"] == algo]
-            plt.plot(xs, ys, marker="o", label=algo)
-        plt.xscale("log", base=2)
-        plt.xlabel("Frames (log2)")
-        plt.ylabel("Page fault rate")
-        plt.title(f"{trace_name} — Page Fault Rate vs Frames")
-        plt.legend()
-        plt.grid(True, which="both", linestyle="--", alpha=0.4)
-        fig1 = outdir / f"{trace_name}_pfr.png"
-        plt.savefig(fig1, dpi=150, bbox_inches="tight")
-        plt.close()
-        print(f"[OK] Wrote {fig1}")
-
-        # 2) disk writes
-        plt.figure()
-        for algo in algos_present:
-            xs = [r["frames"] for r in data if r["algo"] == algo]
-            ys = [r["writes"] for r in data if r["algo"] == algo]
-            plt.plot(xs, ys, marker="o", label=algo)
-        plt.xscale("log", base=2)
-        plt.xlabel("Frames (log2)")
-        plt.ylabel("Total disk writes")
-        plt.title(f"{trace_name} — Disk Writes vs Frames")
-        plt.legend()
-        plt.grid(True, which="both", linestyle="--", alpha=0.4)
-        fig2 = outdir / f"{trace_name}_writes.png"
-        plt.savefig(fig2, dpi=150, bbox_inches="tight")
-        plt.close()
-        print(f"[OK] Wrote {fig2}")
-
-        # 3) disk reads
-        plt.figure()
-        for algo in algos_present:
-            xs = [r["frames"] for r in data if r["algo"] == algo]
-            ys = [r["reads"]  for r in data if r["algo"] == algo]
-            plt.plot(xs, ys, marker="o", label=algo)
-        plt.xscale("log", base=2)
-        plt.xlabel("Frames (log2)")
-        plt.ylabel("Total disk reads")
-        plt.title(f"{trace_name} — Disk Reads vs Frames")
-        plt.legend()
-        plt.grid(True, which="both", linestyle="--", alpha=0.4)
-        fig3 = outdir / f"{trace_name}_reads.png"
-        plt.savefig(fig3, dpi=150, bbox_inches="tight")
-        plt.close()
-        print(f"[OK] Wrote {fig3}")
+        data.sort(key=lambda r: (r.algo, r.frames))
+        algos_present = sorted({r.algo for r in data})
+        for metric, ylabel, title, suffix in plots:
+            ax.clear()
+            for algo in algos_present:
+                xs = [r.frames for r in data if r.algo == algo]
+                ys = [getattr(r, metric) for r in data if r.algo == algo]
+                ax.plot(xs, ys, marker="o", label=algo)
+            ax.set_xscale("log", base=2)
+            ax.set_xlabel("Frames (log2)")
+            ax.set_ylabel(ylabel)
+            ax.set_title(f"{trace_name} — {title}")
+            ax.legend()
+            ax.grid(True, which="both", linestyle="--", alpha=0.4)
+            fig_path = outdir / f"{trace_name}_{suffix}.png"
+            fig.savefig(fig_path, dpi=150, bbox_inches="tight")
+            print(f"[OK] Wrote {fig_path}")
+    plt.close(fig)
 
     # Simple README stub
     md = outdir / "results.md"
@@ -1,28 +1,40 @@
 from mmu import MMU
+from collections import OrderedDict
 
 class LruMMU(MMU):
     def __init__(self, frames):
         # TODO: Constructor logic for LruMMU
         # Number of physical frames in memory
         self.number_frames = frames
-        # Dictionary that tracks the loaded pages
-        self.frames = {}
+        # Ordered dictionary of loaded pages (page -> dirty bit).
+        # Oldest (least recently used) page first, most recent last.
+        # OrderedDict is a doubly-linked list kept in C, so moving and popping
+        # are O(1) without per-access allocation; a slot list with prev/next
+        # arrays (as in mmu_kernels.lru_run) is slower when run as Python code
+        self.frames = OrderedDict()
         # Statistics for analysis
         self.page_faults = 0
         self.disk_reads = 0
         self.disk_writes = 0
         # Debug mode flag
         self.debug = False
-        # Counter to track recency
-        self.recency_tracker = 0
+        # Last accessed page, checked before the dictionary lookup
+        self.last_page = -1
+        self.reset_debug()
 
     def set_debug(self):
         # TODO: Implement the method to set debug mode
         self.debug = True
+        # Use the general read_memory/write_memory, which print from access_memory
+        self.__dict__.pop("read_memory", None)
+        self.__dict__.pop("write_memory", None)
 
     def reset_debug(self):
         # TODO: Implement the method to reset debug mode
         self.debug = False
+        # Dispatch straight to the quiet accessors specialized for reads and writes
+        self.read_memory = self.quiet_read
+        self.write_memory = self.quiet_write
 
     def read_memory(self, page_number):
         # TODO: Implement the method to read memory
@@ -32,6 +44,30 @@ class LruMMU(MMU):
         # TODO: Implement the method to write memory
         self.access_memory(page_number, is_write=True)
 
+    def quiet_read(self, page_number):
+        # Read without debug output: hits are handled here, faults in access_memory
+        if page_number == self.last_page:
+            return
+        frames = self.frames
+        if page_number in frames:
+            frames.move_to_end(page_number)
+            self.last_page = page_number
+            return
+        self.access_memory(page_number, False)
+
+    def quiet_write(self, page_number):
+        # Write without debug output: hits are handled here, faults in access_memory
+        frames = self.frames
+        if page_number == self.last_page:
+            frames[page_number] = True
+            return
+        if page_number in frames:
+            frames.move_to_end(page_number)
+            frames[page_number] = True
+            self.last_page = page_number
+            return
+        self.access_memory(page_number, True)
+
     def get_total_disk_reads(self):
         # TODO: Implement the method to get total disk reads
         return self.disk_reads
@@ -45,42 +81,51 @@ class LruMMU(MMU):
         return self.page_faults
     
     def access_memory(self, page_number, is_write):
-        #  Increase recency tracker on each access
-        self.recency_tracker += 1
+        # Repeated access to the last page: already resident and most recently used
+        if page_number == self.last_page:
+            if is_write:
+                self.frames[page_number] = True
+            if self.debug:
+                print(f"HIT: Page {page_number}. Dirty: {self.frames[page_number]}")
+            return
+
+        # Local aliases for the attributes used on the hit path
+        frames = self.frames
+        debug = self.debug
 
         # Page HIT (in memory)
-        if page_number in self.frames:
+        if page_number in frames:
+            # Mark page as most recently used
+            frames.move_to_end(page_number)
             if is_write:
-                self.frames[page_number]["dirty"] = True
-            self.frames[page_number]["last_used"] = self.recency_tracker
-            if self.debug:
-                print(f"HIT: Page {page_number}. Dirty: {self.frames[page_number]['dirty']}")
+                frames[page_number] = True
+            self.last_page = page_number
+            if debug:
+                print(f"HIT: Page {page_number}. Dirty: {frames[page_number]}")
             return
         
         # Page FAULT (not in memory)
         self.page_faults += 1
         self.disk_reads += 1
-        if self.debug:
+        if debug:
             print(f"FAULT: Page {page_number}")
 
         # If memory is full, remove least recently used page
-        if len(self.frames) >= self.number_frames:
-            # Find least used page
-            removing_page = min(self.frames, key=lambda p: self.frames[p]["last_used"])
-            removing_page_dirty = self.frames[removing_page]["dirty"]
+        if len(frames) >= self.number_frames:
+            # Least recently used page is at the front
+            removing_page, removing_page_dirty = frames.popitem(last=False)
 
             if removing_page_dirty:
                 self.disk_writes += 1
-                if self.debug:
+                if debug:
                     print(f"REMOVING: Dirty {removing_page}")
             else:
-                if self.debug:
+                if debug:
                     print(f"REMOVING: Clean {removing_page}")
 
-            del self.frames[removing_page]
-
         #  Load new page into memory
-        self.frames[page_number] = {"dirty": is_write, "last_used": self.recency_tracker}
-        if self.debug:
+        frames[page_number] = is_write
+        self.last_page = page_number
+        if debug:
             print(f"LOADED: Page {page_number}. Dirty: {is_write}")
 
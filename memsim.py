@@ -61,7 +61,9 @@ def main():
     ############################################################
 
     no_events = 0
-
+    # Bind the MMU methods once instead of looking them up per event
+    read_memory = mmu.read_memory
+    write_memory = mmu.write_memory
 
     with open(input_file, 'r') as trace_file:
         for trace_line in trace_file:
@@ -72,9 +74,9 @@ def main():
 
             # Process read or write
             if trace_cmd[1] == "R":
-                mmu.read_memory(page_number)
+                read_memory(page_number)
             elif trace_cmd[1] == "W":
-                mmu.write_memory(page_number)
+                write_memory(page_number)
             else:
                 print(f"Badly formatted file. Error on line {no_events + 1}")
                 return
@@ -0,0 +1,173 @@
+'''
+* Numba-compiled trace replay kernels for the replacement policies.
+* Each kernel replays a whole trace (page numbers and write flags as NumPy
+* arrays) against a fixed number of frames with no Python objects in the hot
+* loop, and returns (page_faults, disk_reads, disk_writes) with the same
+* meaning as the counters of the matching MMU class.
+* Optional: needs numpy and numba (python -m pip install numba).
+*
+'''
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict
+
+
+@njit(cache=True)
+def clock_run(trace_pages, trace_writes, nframes):
+    # Parallel frame arrays, same layout as ClockMMU
+    pages = np.full(nframes, -1, np.int64)
+    dirty = np.zeros(nframes, np.uint8)
+    reference = np.zeros(nframes, np.uint8)
+    page_to_index = Dict.empty(key_type=types.int64, value_type=types.int64)
+    used_frames = 0
+    clock_hand = 0
+    page_faults = 0
+    disk_writes = 0
+
+    for i in range(trace_pages.shape[0]):
+        page_number = trace_pages[i]
+        is_write = trace_writes[i]
+
+        # Page HIT (in memory)
+        if page_number in page_to_index:
+            index = page_to_index[page_number]
+            reference[index] = 1
+            if is_write:
+                dirty[index] = 1
+            continue
+
+        # Page FAULT (not in memory)
+        page_faults += 1
+        if used_frames < nframes:
+            index = used_frames
+            used_frames += 1
+        else:
+            # Give second chances until a page with reference bit 0 is found
+            while reference[clock_hand]:
+                reference[clock_hand] = 0
+                clock_hand = (clock_hand + 1) % nframes
+            index = clock_hand
+            clock_hand = (clock_hand + 1) % nframes
+            if dirty[index]:
+                disk_writes += 1
+            page_to_index.pop(pages[index])
+
+        pages[index] = page_number
+        dirty[index] = is_write
+        reference[index] = 1
+        page_to_index[page_number] = index
+
+    return page_faults, page_faults, disk_writes
+
+
+@njit(cache=True)
+def lru_run(trace_pages, trace_writes, nframes):
+    # Frame slots linked in recency order: head is least, tail most recently used
+    pages = np.full(nframes, -1, np.int64)
+    dirty = np.zeros(nframes, np.uint8)
+    prev_slot = np.full(nframes, -1, np.int32)
+    next_slot = np.full(nframes, -1, np.int32)
+    head = -1
+    tail = -1
+    page_to_slot = Dict.empty(key_type=types.int64, value_type=types.int64)
+    used_frames = 0
+    page_faults = 0
+    disk_writes = 0
+
+    for i in range(trace_pages.shape[0]):
+        page_number = trace_pages[i]
+        is_write = trace_writes[i]
+
+        # Page HIT (in memory)
+        if page_number in page_to_slot:
+            slot = page_to_slot[page_number]
+            if is_write:
+                dirty[slot] = 1
+            if slot != tail:
+                # Unlink slot (it has a successor since it is not the tail)
+                if prev_slot[slot] >= 0:
+                    next_slot[prev_slot[slot]] = next_slot[slot]
+                else:
+                    head = next_slot[slot]
+                prev_slot[next_slot[slot]] = prev_slot[slot]
+                # Relink slot as most recently used
+                prev_slot[slot] = tail
+                next_slot[slot] = -1
+                next_slot[tail] = slot
+                tail = slot
+            continue
+
+        # Page FAULT (not in memory)
+        page_faults += 1
+        if used_frames < nframes:
+            slot = used_frames
+            used_frames += 1
+        else:
+            # Evict least recently used slot from the head
+            slot = head
+            head = next_slot[slot]
+            if head >= 0:
+                prev_slot[head] = -1
+            else:
+                tail = -1
+            if dirty[slot]:
+                disk_writes += 1
+            page_to_slot.pop(pages[slot])
+
+        pages[slot] = page_number
+        dirty[slot] = is_write
+        page_to_slot[page_number] = slot
+        prev_slot[slot] = tail
+        next_slot[slot] = -1
+        if tail >= 0:
+            next_slot[tail] = slot
+        else:
+            head = slot
+        tail = slot
+
+    return page_faults, page_faults, disk_writes
+
+
+@njit(cache=True)
+def rand_run(trace_pages, trace_writes, nframes, seed=-1):
+    # Frame slots; once memory is full every slot holds a resident page,
+    # so a uniformly random slot is a uniformly random victim
+    pages = np.full(nframes, -1, np.int64)
+    dirty = np.zeros(nframes, np.uint8)
+    page_to_slot = Dict.empty(key_type=types.int64, value_type=types.int64)
+    if seed >= 0:
+        np.random.seed(seed)
+    used_frames = 0
+    page_faults = 0
+    disk_writes = 0
+
+    for i in range(trace_pages.shape[0]):
+        page_number = trace_pages[i]
+        is_write = trace_writes[i]
+
+        # Page HIT (in memory)
+        if page_number in page_to_slot:
+            slot = page_to_slot[page_number]
+            if is_write:
+                dirty[slot] = 1
+            continue
+
+        # Page FAULT (not in memory)
+        page_faults += 1
+        if used_frames < nframes:
+            slot = used_frames
+            used_frames += 1
+        else:
+            slot = np.random.randint(0, nframes)
+            if dirty[slot]:
+                disk_writes += 1
+            page_to_slot.pop(pages[slot])
+
+        pages[slot] = page_number
+        dirty[slot] = is_write
+        page_to_slot[page_number] = slot
+
+    return page_faults, page_faults, disk_writes
+
+
+KERNELS = {"lru": lru_run, "clock": clock_run, "rand": rand_run}
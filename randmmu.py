@@ -1,27 +1,43 @@
 from mmu import MMU
+from array import array
 import random
 
 class RandMMU(MMU):
-    def __init__(self, frames):
+    def __init__(self, frames, rng=None):
         # TODO: Constructor logic for RandMMU
         # Number of physical frames in memory
         self.number_frames = frames
-        # Dictionary that tracks the loaded pages
-        self.frames = {}
+        # Random generator used to choose victims (pass a seeded one for repeatable runs)
+        self.rng = rng if rng is not None else random.Random()
+        # Loaded pages and their dirty bits, indexed by frame
+        self.pages = array('q', [-1]) * frames
+        self.dirty = bytearray(frames)
+        # Map of loaded page -> frame index
+        self.page_to_index = {}
         # Statistics for analysis
         self.page_faults = 0
         self.disk_reads = 0
         self.disk_writes = 0
         # Debug mode flag
         self.debug = False
+        # Last accessed page and its frame, checked before the dictionary lookup
+        self.last_page = -1
+        self.last_index = -1
+        self.reset_debug()
 
     def set_debug(self):
         # TODO: Implement the method to set debug mode
         self.debug = True
+        # Use the general read_memory/write_memory, which print from access_memory
+        self.__dict__.pop("read_memory", None)
+        self.__dict__.pop("write_memory", None)
 
     def reset_debug(self):
         # TODO: Implement the method to reset debug mode
         self.debug = False
+        # Dispatch straight to the quiet accessors specialized for reads and writes
+        self.read_memory = self.quiet_read
+        self.write_memory = self.quiet_write
 
     def read_memory(self, page_number):
         # TODO: Implement the method to read memory
@@ -31,6 +47,30 @@ class RandMMU(MMU):
         # TODO: Implement the method to write memory
         self.access_memory(page_number, is_write=True)
 
+    def quiet_read(self, page_number):
+        # Read without debug output: hits are handled here, faults in access_memory
+        if page_number == self.last_page:
+            return
+        index = self.page_to_index.get(page_number)
+        if index is None:
+            self.access_memory(page_number, False)
+            return
+        self.last_page = page_number
+        self.last_index = index
+
+    def quiet_write(self, page_number):
+        # Write without debug output: hits are handled here, faults in access_memory
+        if page_number == self.last_page:
+            self.dirty[self.last_index] = 1
+            return
+        index = self.page_to_index.get(page_number)
+        if index is None:
+            self.access_memory(page_number, True)
+            return
+        self.dirty[index] = 1
+        self.last_page = page_number
+        self.last_index = index
+
     def get_total_disk_reads(self):
         # TODO: Implement the method to get total disk reads
         return self.disk_reads
@@ -44,38 +84,69 @@ class RandMMU(MMU):
         return self.page_faults
     
     def access_memory(self, page_number, is_write):
-        # Page HIT (in memory)
-        if page_number in self.frames:
+        # Repeated access to the last page: still resident in the same frame
+        if page_number == self.last_page:
             if is_write:
-                self.frames[page_number]["dirty"] = True
+                self.dirty[self.last_index] = 1
             if self.debug:
-                print(f"HIT: Page {page_number}. Dirty: {self.frames[page_number]['dirty']}")
+                print(f"HIT: Page {page_number}. Dirty: {bool(self.dirty[self.last_index])}")
+            return
+
+        # Local aliases for the attributes used on the hit path
+        page_to_index = self.page_to_index
+        dirty = self.dirty
+        debug = self.debug
+
+        # Page HIT (in memory)
+        index = page_to_index.get(page_number)
+        if index is not None:
+            if is_write:
+                dirty[index] = 1
+            self.last_page = page_number
+            self.last_index = index
+            if debug:
+                print(f"HIT: Page {page_number}. Dirty: {bool(dirty[index])}")
             return
         
         # Page FAULT (not in memory)
         self.page_faults += 1
         self.disk_reads += 1
-        if self.debug:
+        if debug:
             print(f"FAULT: Page {page_number}")
         
+        # Fill next free frame if there is space
+        pages = self.pages
+        index = len(page_to_index)
+        if index < self.number_frames:
+            page_to_index[page_number] = index
+            pages[index] = page_number
+            dirty[index] = is_write
+            self.last_page = page_number
+            self.last_index = index
+            if debug:
+                print(f"LOADED: Page {page_number}. Dirty: {is_write}")
+            return
+
         # Page fault due to full memory
-        if len(self.frames) >= self.number_frames:
-            # Selects a random page to remove from memory
-            removing_page = random.choice(list(self.frames.keys()))
-            removing_page_dirty = self.frames[removing_page]["dirty"]
-
-            if removing_page_dirty:
-                self.disk_writes += 1
-                if self.debug:
-                    print(f"REMOVING: Dirty {removing_page}")
-            else:
-                if self.debug:
-                    print(f"REMOVING: Clean {removing_page}")
-
-            del self.frames[removing_page]
-        
-        # Load new page into memory
-        self.frames[page_number] = {"dirty": is_write}
-        if self.debug:
+        # Selects a random frame to remove from memory
+        index = self.rng.randrange(self.number_frames)
+        removing_page = pages[index]
+
+        if dirty[index]:
+            self.disk_writes += 1
+            if debug:
+                print(f"REMOVING: Dirty {removing_page}")
+        else:
+            if debug:
+                print(f"REMOVING: Clean {removing_page}")
+
+        # Load new page into the freed frame
+        del page_to_index[removing_page]
+        page_to_index[page_number] = index
+        pages[index] = page_number
+        dirty[index] = is_write
+        self.last_page = page_number
+        self.last_index = index
+        if debug:
             print(f"LOADED: Page {page_number}. Dirty: {is_write}")
 
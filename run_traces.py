@@ -7,9 +7,27 @@ from dataclasses import dataclass
 
 SUPPORTED_MODES = {"lru", "clock", "rand"}
 
-# Relaxed pattern: optional 0x, hex digits, whitespace, R/W
-HEX_RW_RE = re.compile(r"^\s*(?:0x)?[0-9A-Fa-f]+\s+[RW]\s*$")
-ANS_HINT_RE = re.compile(r"^\s*total\s+memory\s+frames:", re.IGNORECASE)
+HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+# One pass over the five summary lines: "<label>: <value>"
+_LINE_RE = re.compile(
+    r"(?im)^\s*(total memory frames|events in trace|total disk reads|total disk writes|page fault rate)"
+    r"\s*:\s*([\d.]+)"
+)
+_LINE_FIELDS = {
+    "total memory frames": ("frames", int),
+    "events in trace": ("events", int),
+    "total disk reads": ("reads", int),
+    "total disk writes": ("writes", int),
+    "page fault rate": ("rate", float),
+}
+
+def is_trace_line(s: str) -> bool:
+    # Relaxed check: optional 0x, hex digits, whitespace, R/W (plain string ops, no regex)
+    parts = s.split()
+    if len(parts) != 2 or parts[1] not in ("R", "W"):
+        return False
+    addr = parts[0][2:] if parts[0].startswith("0x") else parts[0]
+    return bool(addr) and HEX_DIGITS.issuperset(addr)
 
 @dataclass
 class Case:
@@ -29,9 +47,9 @@ def looks_like_trace(p: Path) -> bool:
                 s = line.strip()
                 if not s or s.startswith("#") or s.startswith("//"):
                     continue
-                if HEX_RW_RE.match(s):
+                if is_trace_line(s):
                     return True
-                if ANS_HINT_RE.match(s):
+                if s.lower().startswith("total memory frames:"):
                     return False
                 # otherwise keep scanning a few lines
     except Exception:
@@ -45,34 +63,22 @@ def looks_like_ans(p: Path) -> bool:
                 line = f.readline()
                 if not line:
                     break
-                s = line.strip().lower()
+                s = line.strip()
                 if not s:
                     continue
-                if s.startswith("total memory frames:"):
+                if s.lower().startswith("total memory frames:"):
                     return True
-                if HEX_RW_RE.match(s):
+                if is_trace_line(s):
                     return False
     except Exception:
         return False
     return False
 
 def parse_stats(s: str):
-    vals = {"frames": None, "events": None, "reads": None, "writes": None, "rate": None}
-    for line in s.splitlines():
-        low = line.strip().lower()
-        if low.startswith("total memory frames:"):
-            vals["frames"] = int(re.findall(r"\d+", line)[0])
-        elif low.startswith("events in trace:"):
-            vals["events"] = int(re.findall(r"\d+", line)[0])
-        elif low.startswith("total disk reads:"):
-            vals["reads"] = int(re.findall(r"\d+", line)[0])
-        elif low.startswith("total disk writes:"):
-            vals["writes"] = int(re.findall(r"\d+", line)[0])
-        elif low.startswith("page fault rate:"):
-            vals["rate"] = float(re.findall(r"[0-9.]+", line)[0])
-    if any(v is None for v in vals.values()):
+    found = dict((m.group(1).lower(), m.group(2)) for m in _LINE_RE.finditer(s))
+    if len(found) != len(_LINE_FIELDS):
         raise ValueError("Could not parse stats from text.")
-    return vals
+    return {key: cast(found[label]) for label, (key, cast) in _LINE_FIELDS.items()}
 
 def find_cases(dir_path: Path):
     # 1) Scan all files, bucket by <base>-<n>frames-<mode>[.ans]